@@ -45,12 +45,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     try:
+        await client.async_start()
         await coordinator.async_config_entry_first_refresh()
         await coordinator.async_start_socket()
     except AuthenticationError as exc:
+        await coordinator.async_stop()
         await client.close()
         raise ConfigEntryAuthFailed("Failed to authenticate with Kumo Cloud") from exc
     except Exception as exc:
+        await coordinator.async_stop()
         await client.close()
         raise ConfigEntryNotReady(exc) from exc
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.climate import (
     ATTR_HVAC_MODE,
@@ -16,16 +16,17 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.event import async_call_later
 
-from .pykumo2 import MitsubishiComfortClient
-
 from .const import DOMAIN
 from .coordinator import MitsubishiComfortCoordinator
 
+if TYPE_CHECKING:
+    from .pykumo2 import DeviceState, MitsubishiComfortClient
+
 _LOGGER = logging.getLogger(__name__)
 
 HVAC_TO_API = {
@@ -60,6 +61,10 @@ SWING_MODES = [
     "vertical",
     "swing",
 ]
+FAN_MODES_SET = frozenset(FAN_MODES)
+SWING_MODES_SET = frozenset(SWING_MODES)
+
+_UNSET = object()
 
 
 async def async_setup_entry(
@@ -83,6 +88,15 @@ async def async_setup_entry(
 class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordinator], ClimateEntity):
     """Representation of a Mitsubishi Comfort indoor unit."""
 
+    __slots__ = (
+        "_client",
+        "_serial",
+        "_device",
+        "_cached_state_key",
+        "_cached_hvac_mode",
+        "_cached_hvac_action",
+    )
+
     _attr_should_poll = False
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_hvac_modes = [
@@ -100,6 +114,14 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
     _attr_target_temperature_step = 0.5
     _attr_fan_modes = FAN_MODES
     _attr_swing_modes = SWING_MODES
+    _attr_supported_features = (
+        ClimateEntityFeature.FAN_MODE
+        | ClimateEntityFeature.SWING_MODE
+        | ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+        | ClimateEntityFeature.TURN_ON
+        | ClimateEntityFeature.TURN_OFF
+    )
 
     def __init__(
         self,
@@ -114,19 +136,56 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
         name = device.name if device else serial
         self._attr_unique_id = f"mitsubishi_comfort_{serial}"
         self._attr_name = name
+        if device:
+            self._attr_device_info = {
+                "identifiers": {(DOMAIN, device.serial)},
+                "name": device.name,
+                "manufacturer": "Mitsubishi Electric",
+                "model": device.model_number or device.raw.get("modelNumber"),
+                "serial_number": device.serial_number or device.serial,
+            }
+        self._device: DeviceState | None = device
+        self._cached_state_key: Any = _UNSET
+        self._cached_hvac_mode: HVACMode | None = None
+        self._cached_hvac_action: HVACAction | None = None
+        self._refresh_cached_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh memoized state before writing it to Home Assistant."""
+        self._refresh_cached_state()
+        super()._handle_coordinator_update()
+
+    def _refresh_cached_state(self) -> None:
+        """Recompute mode/action only when the inputs they depend on changed."""
+        device = self.coordinator.data.get(self._serial)
+        self._device = device
+        if device is None:
+            state_key = None
+        else:
+            display_config = device.display_config or {}
+            state_key = (
+                device.operation_mode,
+                device.power,
+                display_config.get("defrost"),
+                display_config.get("standby"),
+            )
+        if state_key == self._cached_state_key:
+            return
+        self._cached_state_key = state_key
+        self._cached_hvac_mode = self._compute_hvac_mode(device)
+        self._cached_hvac_action = self._compute_hvac_action(device)
 
-    @property
-    def device(self):
-        return self.coordinator.data.get(self._serial)
-
-    @property
-    def available(self) -> bool:
-        device = self.device
-        return device.connected if device else False
+    @staticmethod
+    def _compute_hvac_mode(device: DeviceState | None) -> HVACMode | None:
+        if not device:
+            return None
+        if not device.power:
+            return HVACMode.OFF
+        return API_TO_HVAC.get(device.operation_mode, None)
 
-    @property
-    def hvac_action(self) -> HVACAction | None:
-        device = self.device
+    @staticmethod
+    def _compute_hvac_action(device: DeviceState | None) -> HVACAction:
         if not device or not device.power:
             return HVACAction.OFF
         if device.display_config:
@@ -144,14 +203,27 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
             return HVACAction.FAN
         return HVACAction.IDLE
 
+    @property
+    def device(self):
+        return self._device
+
+    @property
+    def available(self) -> bool:
+        device = self._device
+        return device.connected if device else False
+
+    @property
+    def hvac_action(self) -> HVACAction | None:
+        return self._cached_hvac_action
+
     @property
     def current_temperature(self) -> float | None:
-        device = self.device
+        device = self._device
         return device.room_temp if device else None
 
     @property
     def target_temperature(self) -> float | None:
-        device = self.device
+        device = self._device
         if self.hvac_mode in RANGE_HVAC_MODES:
             return None
         return device.target_temperature() if device else None
@@ -160,53 +232,37 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
     def target_temperature_low(self) -> float | None:
         if self.hvac_mode not in RANGE_HVAC_MODES:
             return None
-        device = self.device
+        device = self._device
         return device.sp_heat if device else None
 
     @property
     def target_temperature_high(self) -> float | None:
         if self.hvac_mode not in RANGE_HVAC_MODES:
             return None
-        device = self.device
+        device = self._device
         return device.sp_cool if device else None
 
     @property
     def hvac_mode(self) -> HVACMode | None:
-        device = self.device
-        if not device:
-            return None
-        if not device.power:
-            return HVACMode.OFF
-        return API_TO_HVAC.get(device.operation_mode, None)
+        return self._cached_hvac_mode
 
     @property
     def fan_mode(self) -> str | None:
-        device = self.device
-        if device and device.fan_speed in FAN_MODES:
+        device = self._device
+        if device and device.fan_speed in FAN_MODES_SET:
             return device.fan_speed
         return "auto"
 
-    @property
-    def supported_features(self) -> int:
-        return (
-            ClimateEntityFeature.FAN_MODE
-            | ClimateEntityFeature.SWING_MODE
-            | ClimateEntityFeature.TARGET_TEMPERATURE
-            | ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
-            | ClimateEntityFeature.TURN_ON
-            | ClimateEntityFeature.TURN_OFF
-        )
-
     @property
     def swing_mode(self) -> str | None:
-        device = self.device
-        if device and device.air_direction in SWING_MODES:
+        device = self._device
+        if device and device.air_direction in SWING_MODES_SET:
             return device.air_direction
         return "auto"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        device = self.device
+        device = self._device
         if not device:
             return {}
         return {
@@ -222,19 +278,6 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
             "standby": device.display_config.get("standby") if device.display_config else None,
         }
 
-    @property
-    def device_info(self) -> dict[str, Any] | None:
-        device = self.device
-        if not device:
-            return None
-        return {
-            "identifiers": {(DOMAIN, device.serial)},
-            "name": device.name,
-            "manufacturer": "Mitsubishi Electric",
-            "model": device.model_number or device.raw.get("modelNumber"),
-            "serial_number": device.serial_number or device.serial,
-        }
-
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set target temperature (Celsius) and optionally HVAC mode."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
@@ -244,7 +287,7 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
         if temperature is None and temp_low is None and temp_high is None:
             return
 
-        device = self.device
+        device = self._device
         if hvac_mode is None:
             # use existing mode
             hvac_mode = self.hvac_mode
@@ -272,7 +315,7 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
             _LOGGER.warning("Unsupported HVAC mode: %s", hvac_mode)
             return
 
-        await self._client.async_send_command(self._serial, commands)
+        await self.coordinator.async_send_coalesced(self._serial, commands)
 
         # Optimistically update in-memory state to avoid UI flicker
         if device:
@@ -283,7 +326,7 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
             if "operationMode" in commands:
                 device.operation_mode = commands["operationMode"]
             device.power = True
-            self.coordinator.async_set_updated_data(dict(self.coordinator.data))
+            self.coordinator.async_notify_listeners()
 
         # Protect setpoints/mode from stale socket updates for a short window
         self.coordinator.register_command_hold(
@@ -295,12 +338,12 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         api_mode = HVAC_TO_API[hvac_mode]
         commands = {"operationMode": api_mode, "power": 0 if hvac_mode == HVACMode.OFF else 1}
-        await self._client.async_send_command(self._serial, commands)
-        device = self.device
+        await self.coordinator.async_send_coalesced(self._serial, commands)
+        device = self._device
         if device:
             device.operation_mode = api_mode
             device.power = commands["power"] == 1
-            self.coordinator.async_set_updated_data(dict(self.coordinator.data))
+            self.coordinator.async_notify_listeners()
         self.coordinator.register_command_hold(
             self._serial,
             {"operationMode", "power"},
@@ -308,7 +351,7 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
         )
 
     async def async_turn_on(self) -> None:
-        device = self.device
+        device = self._device
         commands = {"power": 1}
         hvac_mode = None
         if device and device.operation_mode:
@@ -316,11 +359,11 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
         if hvac_mode is None or hvac_mode == HVACMode.OFF:
             hvac_mode = HVACMode.HEAT
         commands["operationMode"] = HVAC_TO_API[hvac_mode]
-        await self._client.async_send_command(self._serial, commands)
+        await self.coordinator.async_send_coalesced(self._serial, commands)
         if device:
             device.power = True
             device.operation_mode = commands["operationMode"]
-            self.coordinator.async_set_updated_data(dict(self.coordinator.data))
+            self.coordinator.async_notify_listeners()
         self.coordinator.register_command_hold(
             self._serial,
             {"operationMode", "power"},
@@ -328,11 +371,11 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
         )
 
     async def async_turn_off(self) -> None:
-        await self._client.async_send_command(self._serial, {"power": 0})
-        device = self.device
+        await self.coordinator.async_send_coalesced(self._serial, {"power": 0})
+        device = self._device
         if device:
             device.power = False
-            self.coordinator.async_set_updated_data(dict(self.coordinator.data))
+            self.coordinator.async_notify_listeners()
         self.coordinator.register_command_hold(
             self._serial,
             {"power"},
@@ -340,7 +383,7 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
         )
 
     async def async_toggle(self) -> None:
-        device = self.device
+        device = self._device
         if device and device.power:
             await self.async_turn_off()
         else:
@@ -350,16 +393,16 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
         if not fan_mode:
             _LOGGER.warning("Ignoring invalid fan mode request: %s", fan_mode)
             return
-        fan_mode = fan_mode if fan_mode in FAN_MODES else fan_mode.lower()
-        if fan_mode not in FAN_MODES:
+        fan_mode = fan_mode if fan_mode in FAN_MODES_SET else fan_mode.lower()
+        if fan_mode not in FAN_MODES_SET:
             _LOGGER.warning("Ignoring invalid fan mode request: %s", fan_mode)
             return
-        await self._client.async_send_command(self._serial, {"fanSpeed": fan_mode})
+        await self.coordinator.async_send_coalesced(self._serial, {"fanSpeed": fan_mode})
         # Optimistic update to avoid snap-back while waiting for socket
-        device = self.device
+        device = self._device
         if device:
             device.fan_speed = fan_mode
-            self.coordinator.async_set_updated_data(dict(self.coordinator.data))
+            self.coordinator.async_notify_listeners()
         self.coordinator.register_command_hold(
             self._serial,
             {"fanSpeed"},
@@ -370,15 +413,15 @@ class MitsubishiComfortClimateEntity(CoordinatorEntity[MitsubishiComfortCoordina
         if not swing_mode:
             _LOGGER.warning("Ignoring invalid swing mode request: %s", swing_mode)
             return
-        swing_mode = swing_mode if swing_mode in SWING_MODES else swing_mode.lower()
-        if swing_mode not in SWING_MODES:
+        swing_mode = swing_mode if swing_mode in SWING_MODES_SET else swing_mode.lower()
+        if swing_mode not in SWING_MODES_SET:
             _LOGGER.warning("Ignoring invalid swing mode request: %s", swing_mode)
             return
-        await self._client.async_send_command(self._serial, {"airDirection": swing_mode})
-        device = self.device
+        await self.coordinator.async_send_coalesced(self._serial, {"airDirection": swing_mode})
+        device = self._device
         if device:
             device.air_direction = swing_mode
-            self.coordinator.async_set_updated_data(dict(self.coordinator.data))
+            self.coordinator.async_notify_listeners()
         self.coordinator.register_command_hold(
             self._serial,
             {"airDirection"},
@@ -19,6 +19,7 @@ class MitsubishiComfortConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     _auth_data: dict | None = None
     _sites: list[dict] = []
+    _site_options: dict[str, str] | None = None
 
     async def async_step_user(self, user_input: dict | None = None) -> FlowResult:
         """Handle credential collection."""
@@ -33,6 +34,7 @@ class MitsubishiComfortConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 await client.async_login()
                 self._sites = await client.async_get_sites()
+                self._site_options = None
             except AuthenticationError:
                 errors["base"] = "invalid_auth"
             except Exception:
@@ -67,7 +69,13 @@ class MitsubishiComfortConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if not self._auth_data:
             return await self.async_step_user()
 
-        site_options = {str(site["id"]): site.get("name", site["id"]) for site in self._sites}
+        site_options = self._site_options
+        if site_options is None:
+            site_options = {}
+            for site in self._sites:
+                site_id = str(site["id"])
+                site_options[site_id] = site.get("name") or site_id
+            self._site_options = site_options
         if user_input is not None:
             site_ids: list[str] = user_input.get(CONF_SITE_IDS, [])
             await self.async_set_unique_id(self._auth_data[CONF_USERNAME])
@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from datetime import timedelta
-from typing import Dict, Set, Tuple
-import time
+from typing import Any, Dict, Iterable, Set
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .pykumo2 import (
@@ -18,18 +17,25 @@ from .pykumo2 import (
     MitsubishiComfortError,
     SocketUpdateManager,
 )
+from .pykumo2.models import STATE_FIELDS, state_snapshot
 from .pykumo2.payloads import (
     AdapterUpdatePayload,
     AcoilUpdatePayload,
-    DeviceStatusV2Payload,
-    DeviceUpdatePayload,
     ProfileUpdatePayload,
+    apply_device_status_v2,
 )
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Socket bursts are coalesced into one listener update per cooldown window
+SOCKET_PUSH_COOLDOWN = 0.25
+# Commands issued within this window are merged into a single request
+COMMAND_COALESCE_DELAY = 0.1
+# Changes to these keys are pushed to entities right away
+IMMEDIATE_PUSH_KEYS = frozenset({"operation_mode", "power", "connected"})
+
 
 class MitsubishiComfortCoordinator(DataUpdateCoordinator[Dict[str, DeviceState]]):
     """Fetch data via REST and keep it fresh via socket events."""
@@ -46,26 +52,70 @@ class MitsubishiComfortCoordinator(DataUpdateCoordinator[Dict[str, DeviceState]]
             _LOGGER,
             name="Mitsubishi Comfort",
             update_interval=timedelta(minutes=10),
+            # DeviceState compares its state fields (not raw payloads), so identical polls skip listeners
+            always_update=False,
         )
         self.client = client
         self.site_ids = site_ids or []
         self.refresh_on_connect = refresh_on_connect
         self._socket: SocketUpdateManager | None = None
+        self._last_successful_refresh = float("-inf")
         self._lock = asyncio.Lock()
-        # Holds: serial -> (expires_at_monotonic, protected_keys)
-        self._holds: Dict[str, Tuple[float, Set[str]]] = {}
+        # Holds: serial -> {protected_key: expires_at_loop_time}
+        self._holds: Dict[str, Dict[str, float]] = {}
+        self._hold_timers: Dict[str, asyncio.TimerHandle] = {}
+        self._pending_commands: Dict[str, Dict[str, Any]] = {}
+        self._pending_cmd_tasks: Dict[str, asyncio.Task] = {}
+        # Socket updates: (serial, changed_fields), drained in batches
+        self._event_queue: asyncio.Queue[tuple[str, Set[str]]] = asyncio.Queue()
+        self._drain_task: asyncio.Task | None = None
+        self._notify_handle: asyncio.Handle | None = None
+        self._push_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=SOCKET_PUSH_COOLDOWN,
+            immediate=True,
+            # The debouncer already coalesces, so it fans out directly
+            function=self.async_update_listeners,
+            background=True,
+        )
 
     async def _async_update_data(self) -> Dict[str, DeviceState]:
         """Fetch latest device data via REST."""
-        try:
-            devices: Dict[str, DeviceState] = {}
-            target_sites = self.site_ids or [None]
-            for site_id in target_sites:
-                devices.update(await self.client.async_get_devices(site_id))
-            # DataUpdateCoordinator expects a new object to trigger updates
-            return dict(devices)
-        except MitsubishiComfortError as exc:
+        target_sites = self.site_ids or [None]
+        results = await asyncio.gather(
+            *(self.client.async_get_devices(site_id) for site_id in target_sites),
+            return_exceptions=True,
+        )
+
+        devices: Dict[str, DeviceState] = {}
+        failures: Dict[str | None, MitsubishiComfortError] = {}
+        for site_id, result in zip(target_sites, results):
+            if isinstance(result, MitsubishiComfortError):
+                failures[site_id] = result
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            devices.update(result)
+
+        if len(failures) == len(target_sites):
+            exc = next(iter(failures.values()))
             raise UpdateFailed(str(exc)) from exc
+        for site_id, exc in failures.items():
+            self.logger.warning("Failed to fetch devices for site %s: %s", site_id, exc)
+        if failures and self.data:
+            # Keep the last known devices for sites that failed this round
+            devices = {**self.data, **devices}
+        if self.data:
+            # Keep unchanged devices as the same objects entities already reference
+            previous = self.data
+            for serial, device in devices.items():
+                current = previous.get(serial)
+                if current is not None and current == device:
+                    devices[serial] = current
+        self._last_successful_refresh = self.hass.loop.time()
+        # devices is built fresh for every refresh, so no defensive copy is needed
+        return devices
 
     async def async_start_socket(self) -> None:
         """Start the socket listener for live updates."""
@@ -74,24 +124,64 @@ class MitsubishiComfortCoordinator(DataUpdateCoordinator[Dict[str, DeviceState]]
                 return
             if not self.data:
                 return
+            if self._drain_task is None:
+                self._drain_task = self.hass.async_create_background_task(
+                    self._async_drain_socket_events(), f"{DOMAIN} socket event drain"
+                )
             serials = list(self.data.keys())
             self._socket = SocketUpdateManager(
                 client=self.client,
                 device_serials=serials,
                 callback=self._handle_socket_event,
                 refresh_on_connect=self.refresh_on_connect,
+                refresh_predicate=self._should_force_refresh,
             )
             await self._socket.start()
 
+    def _should_force_refresh(self) -> bool:
+        """Only force adapter refreshes on reconnect when REST data is getting old."""
+        max_age = self.update_interval.total_seconds() / 2 if self.update_interval else 0
+        return self.hass.loop.time() - self._last_successful_refresh > max_age
+
     async def async_stop(self) -> None:
         """Stop socket listener."""
         async with self._lock:
             if self._socket:
                 await self._socket.stop()
             self._socket = None
+        if self._drain_task:
+            self._drain_task.cancel()
+            self._drain_task = None
+        self._push_debouncer.async_shutdown()
+        if self._notify_handle:
+            self._notify_handle.cancel()
+            self._notify_handle = None
+        for task in self._pending_cmd_tasks.values():
+            task.cancel()
+        self._pending_cmd_tasks.clear()
+        self._pending_commands.clear()
+        for timer in self._hold_timers.values():
+            timer.cancel()
+        self._hold_timers.clear()
+        self._holds.clear()
+
+    @callback
+    def async_notify_listeners(self) -> None:
+        """Notify entities after device state was mutated in place.
 
-    async def _handle_socket_event(self, event: str, payload: dict) -> None:
-        """Handle incoming socket event and update coordinator data."""
+        Calls made within the same loop iteration share a single fan-out.
+        """
+        if self._notify_handle is None:
+            self._notify_handle = self.hass.loop.call_soon(self._do_notify)
+
+    @callback
+    def _do_notify(self) -> None:
+        self._notify_handle = None
+        self.async_update_listeners()
+
+    @callback
+    def _handle_socket_event(self, event: str, payload: dict) -> None:
+        """Apply an incoming socket event and queue the resulting changes."""
         if event not in (
             "device_update",
             "device_status_v2",
@@ -108,35 +198,28 @@ class MitsubishiComfortCoordinator(DataUpdateCoordinator[Dict[str, DeviceState]]
         # Respect command holds: ignore protected keys while a recent command is pending
         hold = self._holds.get(serial)
         if hold:
-            expires_at, protected = hold
-            if time.monotonic() >= expires_at:
-                self._holds.pop(serial, None)
-            else:
-                payload = dict(payload)
-                for key in list(payload.keys()):
-                    if key in protected:
-                        payload.pop(key)
-                        self.logger.debug(
-                            "Ignoring stale %s for %s due to command hold; payload=%s",
-                            key,
-                            serial,
-                            payload,
-                        )
+            held = hold.keys() & payload.keys()
+            if held:
+                now = self.hass.loop.time()
+                expired = {key for key in held if hold[key] <= now}
+                for key in expired:
+                    del hold[key]
+                held -= expired
+            if held:
+                payload = {key: value for key, value in payload.items() if key not in held}
+                self.logger.debug(
+                    "Ignoring stale %s for %s due to command hold; payload=%s",
+                    sorted(held),
+                    serial,
+                    payload,
+                )
 
         device = self.data[serial]
-        before_state = {
-            "mode": device.operation_mode,
-            "power": device.power,
-            "fan": device.fan_speed,
-            "vane": device.air_direction,
-            "roomTemp": device.room_temp,
-            "spCool": device.sp_cool,
-            "spHeat": device.sp_heat,
-        }
+        before_state = state_snapshot(device)
         if event == "device_update":
-            DeviceUpdatePayload.model_validate(payload).apply_to_device(device)
+            device.apply_update(payload)
         elif event == "device_status_v2":
-            DeviceStatusV2Payload.model_validate(payload).apply_to_device(device)
+            apply_device_status_v2(device, payload)
         elif event == "profile_update":
             ProfileUpdatePayload.model_validate(payload).apply_to_device(device)
         elif event == "adapter_update":
@@ -144,33 +227,88 @@ class MitsubishiComfortCoordinator(DataUpdateCoordinator[Dict[str, DeviceState]]
         elif event == "acoil_update":
             AcoilUpdatePayload.model_validate(payload).apply_to_device(device)
 
-        after_state = {
-            "mode": device.operation_mode,
-            "power": device.power,
-            "fan": device.fan_speed,
-            "vane": device.air_direction,
-            "roomTemp": device.room_temp,
-            "spCool": device.sp_cool,
-            "spHeat": device.sp_heat,
-        }
-        changes: Dict[str, tuple] = {
-            key: (before_state.get(key), after_state.get(key))
-            for key in after_state
-            if before_state.get(key) != after_state.get(key)
+        after_state = state_snapshot(device)
+        if after_state == before_state:
+            # Heartbeats and raw-only frames do not affect any entity
+            return
+        changes = {
+            field
+            for field, before, after in zip(STATE_FIELDS, before_state, after_state)
+            if before != after
         }
-        if changes:
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
                 "Device %s state updated via socket: %s",
                 serial,
-                json.dumps(changes, indent=2, sort_keys=True),
+                {
+                    field: (before, after)
+                    for field, before, after in zip(STATE_FIELDS, before_state, after_state)
+                    if field in changes
+                },
             )
 
-        # Push updated state to entities
-        self.async_set_updated_data(dict(self.data))
+        self._event_queue.put_nowait((serial, changes))
+
+    async def _async_drain_socket_events(self) -> None:
+        """Fan out queued socket changes, one listener update per burst."""
+        while True:
+            serial, changes = await self._event_queue.get()
+            serials = {serial}
+            while not self._event_queue.empty():
+                serial, more = self._event_queue.get_nowait()
+                serials.add(serial)
+                changes |= more
+            self.logger.debug("Pushing socket changes for %s: %s", serials, changes)
+            # Push mode/power/availability changes right away; coalesce everything else
+            if changes & IMMEDIATE_PUSH_KEYS:
+                self.async_notify_listeners()
+            else:
+                self._push_debouncer.async_schedule_call()
+
+    async def async_send_coalesced(self, serial: str, commands: Dict[str, Any]) -> None:
+        """Merge commands for a device and send them in one request after a short delay."""
+        self._pending_commands.setdefault(serial, {}).update(commands)
+        task = self._pending_cmd_tasks.get(serial)
+        if task is None:
+            task = self.hass.async_create_task(self._async_flush_commands(serial))
+            task.add_done_callback(self._log_flush_failure)
+            self._pending_cmd_tasks[serial] = task
+        await asyncio.shield(task)
 
-    def register_command_hold(self, serial: str, protected_keys: Set[str], duration: float = 10.0) -> None:
+    async def _async_flush_commands(self, serial: str) -> None:
+        """Send the merged commands for a device."""
+        await asyncio.sleep(COMMAND_COALESCE_DELAY)
+        self._pending_cmd_tasks.pop(serial, None)
+        commands = self._pending_commands.pop(serial, {})
+        if commands:
+            await self.client.async_send_command(serial, commands)
+
+    def _log_flush_failure(self, task: asyncio.Task) -> None:
+        """Retrieve a failed send, which goes unobserved if every caller was cancelled."""
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            self.logger.debug("Coalesced command send failed: %s", exc)
+
+    def register_command_hold(
+        self, serial: str, protected_keys: Iterable[str], duration: float = 10.0
+    ) -> None:
         """Protect specific keys from being overwritten by stale updates for a short window."""
-        self._holds[serial] = (time.monotonic() + duration, set(protected_keys))
+        now = self.hass.loop.time()
+        expires = dict.fromkeys(protected_keys, now + duration)
+        if not expires:
+            return
+        hold = self._holds.setdefault(serial, {})
+        hold.update(expires)
+        if timer := self._hold_timers.pop(serial, None):
+            timer.cancel()
+        self._hold_timers[serial] = self.hass.loop.call_later(
+            max(hold.values()) - now, self._release_hold, serial
+        )
+
+    @callback
+    def _release_hold(self, serial: str) -> None:
+        """Drop an expired command hold."""
+        self._holds.pop(serial, None)
+        self._hold_timers.pop(serial, None)
 
 
 async def async_unload_coordinator(hass: HomeAssistant, entry_id: str) -> None:
@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.components.number import NumberDeviceClass, NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import MitsubishiComfortCoordinator
-from .pykumo2 import MitsubishiComfortClient
+
+if TYPE_CHECKING:
+    from .pykumo2 import DeviceState, MitsubishiComfortClient
 
 OFFSET_MIN_C = -5.0
 OFFSET_MAX_C = 5.0
 OFFSET_STEP_C = 0.5
+# Command keys resent after a calibration change, mapped to DeviceState attributes
+SETPOINT_ATTRS = {"spCool": "sp_cool", "spHeat": "sp_heat"}
 
 
 async def async_setup_entry(
@@ -44,6 +50,8 @@ def _build_numbers(
 class _BaseMitsubishiNumber(CoordinatorEntity[MitsubishiComfortCoordinator], NumberEntity):
     """Shared behavior for Mitsubishi Comfort number entities."""
 
+    __slots__ = ("_client", "_serial", "_device")
+
     _attr_should_poll = False
 
     def __init__(
@@ -57,31 +65,34 @@ class _BaseMitsubishiNumber(CoordinatorEntity[MitsubishiComfortCoordinator], Num
         self._client = client
         self._serial = serial
         device = coordinator.data.get(serial)
+        self._device: DeviceState | None = device
         base_name = device.name if device else serial
         self._attr_unique_id = f"mitsubishi_comfort_{serial}_{name_suffix}"
         self._attr_name = f"{base_name} {name_suffix.replace('_', ' ').title()}"
+        if device:
+            self._attr_device_info = {
+                "identifiers": {(DOMAIN, device.serial)},
+                "name": device.name,
+                "manufacturer": "Mitsubishi Electric",
+                "model": device.model_number or device.raw.get("modelNumber"),
+                "serial_number": device.serial_number or device.serial,
+            }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._device = self.coordinator.data.get(self._serial)
+        super()._handle_coordinator_update()
 
     @property
     def device(self):
-        return self.coordinator.data.get(self._serial)
-
-    @property
-    def device_info(self):
-        device = self.device
-        if not device:
-            return None
-        return {
-            "identifiers": {(DOMAIN, device.serial)},
-            "name": device.name,
-            "manufacturer": "Mitsubishi Electric",
-            "model": device.model_number or device.raw.get("modelNumber"),
-            "serial_number": device.serial_number or device.serial,
-        }
+        return self._device
 
 
 class MitsubishiComfortLocalTempCalibrationNumber(_BaseMitsubishiNumber):
     """Expose local room temperature calibration."""
 
+    __slots__ = ()
+
     _attr_device_class = NumberDeviceClass.TEMPERATURE_DELTA
     _attr_entity_category = EntityCategory.CONFIG
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -100,36 +111,35 @@ class MitsubishiComfortLocalTempCalibrationNumber(_BaseMitsubishiNumber):
 
     @property
     def native_value(self):
-        device = self.device
+        device = self._device
         return device.room_temp_offset if device else None
 
     async def async_set_native_value(self, value: float) -> None:
-        device = self.device
+        device = self._device
         prior_sp_cool = device.sp_cool if device else None
         prior_sp_heat = device.sp_heat if device else None
 
-        await self._client.async_set_room_temp_offset(self._serial, float(value))
-        if device:
-            device.room_temp_offset = float(value)
-            self.coordinator.async_set_updated_data(dict(self.coordinator.data))
-
         commands: dict[str, float] = {}
         if prior_sp_cool is not None:
             commands["spCool"] = prior_sp_cool
         if prior_sp_heat is not None:
             commands["spHeat"] = prior_sp_heat
-        if not commands:
-            return
 
-        await self._client.async_send_command(self._serial, commands)
+        await self._client.async_set_room_temp_offset(self._serial, float(value))
+        # The server holds the new offset now, even if the setpoint restore below fails
         if device:
-            if "spCool" in commands:
-                device.sp_cool = commands["spCool"]
-            if "spHeat" in commands:
-                device.sp_heat = commands["spHeat"]
-            self.coordinator.async_set_updated_data(dict(self.coordinator.data))
-        self.coordinator.register_command_hold(
-            self._serial,
-            set(commands.keys()),
-            duration=10.0,
-        )
+            device.room_temp_offset = float(value)
+        try:
+            if commands:
+                await self._client.async_send_command(self._serial, commands)
+                if device:
+                    for key, setpoint in commands.items():
+                        setattr(device, SETPOINT_ATTRS[key], setpoint)
+                self.coordinator.register_command_hold(
+                    self._serial,
+                    commands.keys(),
+                    duration=10.0,
+                )
+        finally:
+            if device:
+                self.coordinator.async_notify_listeners()
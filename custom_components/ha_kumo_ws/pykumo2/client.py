@@ -4,16 +4,41 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import json
-from typing import Any, Iterable, List, Sequence
+from typing import Any, Awaitable, Iterable, List, Sequence
 
 import httpx
-
-from .const import BASE_URL, DEFAULT_FORCE_REQUESTS, DEFAULT_HEADERS, SOCKET_URL
+from pydantic import TypeAdapter
+
+from .const import (
+    APP_VERSION,
+    BASE_URL,
+    DEFAULT_FORCE_REQUESTS,
+    DEFAULT_HEADERS,
+    MAX_CONCURRENT_REQUESTS,
+    SOCKET_URL,
+)
 from .errors import AuthenticationError, MitsubishiComfortError
+from .jsonutil import json_dumps, json_dumps_pretty, json_loads
 from .models import DeviceState, TokenInfo
 from .payloads import DeviceDetailsResponse, DeviceStatusResponse, ZoneResponse
 
+# One pooled client serves REST calls for every device; keep connections warm between polls
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Validates a whole zones list in one pydantic-core call
+_ZONES_ADAPTER = TypeAdapter(list[ZoneResponse])
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _log_background_renewal(task: asyncio.Task[None]) -> None:
+    """Consume the outcome of a proactive renewal; the next request retries inline."""
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        _LOGGER.debug("Background token renewal failed: %s", exc)
+
+
 class MitsubishiComfortClient:
     """Async HTTP client that mirrors the behavior of the mobile app."""
 
@@ -24,23 +49,36 @@ class MitsubishiComfortClient:
 
         self._client: httpx.AsyncClient | None = None
         self._tokens: TokenInfo | None = None
+        self._auth_header: str | None = None
         self._auth_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
 
     async def close(self) -> None:
         """Close the underlying HTTP client."""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
         if self._client:
             await self._client.aclose()
             self._client = None
 
+    async def async_start(self) -> None:
+        """Create the shared HTTP client up front; pair with close()."""
+        await self._ensure_http_client()
+
     async def _ensure_http_client(self) -> httpx.AsyncClient:
-        """Lazily create the HTTP client in a thread to avoid blocking the loop."""
+        """Lazily create the HTTP client in a thread to avoid blocking the loop.
+
+        Building the client loads the SSL trust store, which Home Assistant flags as
+        blocking I/O, so construction stays off the event loop.
+        """
         if self._client is None:
             self._client = await asyncio.to_thread(
                 httpx.AsyncClient,
                 base_url=BASE_URL,
                 headers=DEFAULT_HEADERS,
                 http2=True,
-                timeout=30.0,
+                limits=HTTP_LIMITS,
+                timeout=HTTP_TIMEOUT,
             )
         return self._client
 
@@ -52,7 +90,7 @@ class MitsubishiComfortClient:
             json={
                 "username": self.username,
                 "password": self.password,
-                "appVersion": DEFAULT_HEADERS["x-app-version"],
+                "appVersion": APP_VERSION,
             },
         )
 
@@ -61,7 +99,7 @@ class MitsubishiComfortClient:
 
         data = response.json()
         token_data = data.get("token", {})
-        self._tokens = TokenInfo.from_response(token_data)
+        self._set_tokens(TokenInfo.from_response(token_data))
         return data
 
     async def _refresh_token(self) -> None:
@@ -80,22 +118,55 @@ class MitsubishiComfortClient:
             raise AuthenticationError(f"Token refresh failed: {response.text}")
 
         data = response.json()
-        self._tokens = TokenInfo.from_response(data)
+        self._set_tokens(TokenInfo.from_response(data))
+
+    def _set_tokens(self, tokens: TokenInfo) -> None:
+        """Store new tokens and the Authorization header derived from them."""
+        self._tokens = tokens
+        self._auth_header = f"Bearer {tokens.access}"
 
     async def _ensure_authenticated(self) -> None:
         """Ensure valid access token before making a request."""
+        # Fast path: a valid token needs no lock, so concurrent requests stay concurrent
+        if self._tokens and not self._tokens.is_access_expired():
+            # Renew shortly before expiry in the background; this request uses the current token
+            if self._tokens.is_access_near_expiry() and (
+                self._refresh_task is None or self._refresh_task.done()
+            ):
+                self._refresh_task = asyncio.create_task(self._async_renew_tokens())
+                self._refresh_task.add_done_callback(_log_background_renewal)
+            return
+
         async with self._auth_lock:
-            if not self._tokens:
-                await self.async_login()
+            if self._tokens and not self._tokens.is_access_expired():
                 return
+            task = self._shared_renewal()
 
-            if not self._tokens.is_access_expired():
-                return
+        await asyncio.shield(task)
 
-            if self._tokens.is_refresh_expired():
-                await self.async_login()
-            else:
-                await self._refresh_token()
+    async def _async_renew_rejected_token(self, rejected_header: str) -> None:
+        """Renew after a 401; concurrent rejections of the same token share one renewal."""
+        async with self._auth_lock:
+            if self._auth_header != rejected_header:
+                # Another request already replaced the rejected token
+                return
+            task = self._shared_renewal()
+
+        await asyncio.shield(task)
+
+    def _shared_renewal(self) -> asyncio.Task[None]:
+        """Return the in-flight token renewal, starting one if none is running."""
+        # Concurrent callers share one in-flight renewal
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._async_renew_tokens())
+        return self._refresh_task
+
+    async def _async_renew_tokens(self) -> None:
+        """Refresh the access token, falling back to a full login."""
+        if not self._tokens or self._tokens.is_refresh_expired():
+            await self.async_login()
+        else:
+            await self._refresh_token()
 
     async def _request(
         self,
@@ -106,42 +177,49 @@ class MitsubishiComfortClient:
         extra_headers: dict[str, str] | None = None,
     ) -> Any:
         """Issue an HTTP request with automatic token refresh."""
-        headers: dict[str, str] = {}
+        # Only per-request headers; httpx merges them over the client defaults
+        headers: dict[str, str] | None = None
         if require_auth:
             await self._ensure_authenticated()
-            if not self._tokens:
+            if self._auth_header is None:
                 raise AuthenticationError("Missing token after authentication.")
-            headers["Authorization"] = f"Bearer {self._tokens.access}"
+            headers = {"Authorization": self._auth_header}
+        # Pre-encode once; the same bytes are reused if the request is retried
+        content: bytes | None = None
+        if json_data is not None:
+            content = json_dumps(json_data)
+            headers = {**headers, **_JSON_HEADERS} if headers else _JSON_HEADERS
         if extra_headers:
-            headers.update(extra_headers)
+            headers = {**headers, **extra_headers} if headers else extra_headers
 
         client = await self._ensure_http_client()
-        # Debug log outbound request
-        _logger = logging.getLogger(__name__)
-        _logger.debug(
-            "HTTP %s %s %s",
-            method,
-            endpoint,
-            json.dumps(json_data, sort_keys=True, indent=2) if json_data else "",
-        )
+        # Debug log outbound request; skip serializing the body unless it is emitted
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug(
+                "HTTP %s %s %s",
+                method,
+                endpoint,
+                json_dumps_pretty(json_data) if json_data else "",
+            )
         response = await client.request(
             method,
             endpoint,
-            json=json_data,
+            content=content,
             headers=headers,
         )
 
         # Retry once on 401 using a refreshed access token
         if response.status_code == 401 and require_auth:
-            await self._refresh_token()
-            if not self._tokens:
+            await self._async_renew_rejected_token(headers["Authorization"])
+            if self._auth_header is None:
                 raise AuthenticationError("Refresh failed, no token present.")
-            headers["Authorization"] = f"Bearer {self._tokens.access}"
+            headers = {**(headers or {}), "Authorization": self._auth_header}
             client = await self._ensure_http_client()
             response = await client.request(
                 method,
                 endpoint,
-                json=json_data,
+                content=content,
                 headers=headers,
             )
 
@@ -150,25 +228,27 @@ class MitsubishiComfortClient:
                 f"API error {response.status_code}: {response.text}"
             )
 
-        if not response.content:
+        raw = response.content
+        if not raw:
             return {}
         try:
-            body = response.json()
+            body = json_loads(raw)
         except ValueError:
             body = response.text
-        _logger.debug(
-            "HTTP %s %s response %s:\n%s",
-            method,
-            endpoint,
-            response.status_code,
-            json.dumps(body, indent=2, sort_keys=True) if isinstance(body, dict) else body,
-        )
+        if debug:
+            _LOGGER.debug(
+                "HTTP %s %s response %s:\n%s",
+                method,
+                endpoint,
+                response.status_code,
+                json_dumps_pretty(body) if isinstance(body, dict) else body,
+            )
         return body
 
     async def async_get_sites(self) -> list[dict[str, Any]]:
         """Return all sites associated with the account."""
         result = await self._request("GET", "/v3/sites/")
-        return list(result or [])
+        return result if isinstance(result, list) else []
 
     async def async_get_zones(self, site_id: str | None = None) -> list[dict[str, Any]]:
         """Return all zones for a site."""
@@ -176,13 +256,13 @@ class MitsubishiComfortClient:
         if not target_site:
             raise MitsubishiComfortError("Site ID is required to fetch zones.")
         result = await self._request("GET", f"/v3/sites/{target_site}/zones")
-        return list(result or [])
+        return result if isinstance(result, list) else []
 
     async def async_get_devices(self, site_id: str | None = None) -> dict[str, DeviceState]:
         """Return device states keyed by serial, built from the zones endpoint."""
         devices: dict[str, DeviceState] = {}
-        for zone in await self.async_get_zones(site_id):
-            zone_payload = ZoneResponse.model_validate(zone)
+        zones = _ZONES_ADAPTER.validate_python(await self.async_get_zones(site_id))
+        for zone_payload in zones:
             adapter = zone_payload.adapter
             serial = adapter.deviceSerial if adapter else None
             if not serial:
@@ -199,23 +279,30 @@ class MitsubishiComfortClient:
             zone_payload.apply_to_device(device)
             devices[serial] = device
 
-        # Enrich missing model numbers via device endpoint (one per missing device)
-        for serial, device in devices.items():
-            if device.model_number:
-                continue
-            try:
-                details = await self._request("GET", f"/v3/devices/{serial}")
-                DeviceDetailsResponse.model_validate(details).apply_to_device(device)
-            except Exception:
-                # Best-effort; skip if request fails
-                continue
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def _limited(coro: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await coro
+
+        # Enrich missing model numbers and offsets in one batch, tagged by response model
+        pending: list[tuple[DeviceState, type[DeviceDetailsResponse | DeviceStatusResponse]]] = []
+        requests: list[Awaitable[Any]] = []
         for serial, device in devices.items():
-            if device.room_temp_offset is not None:
+            if not device.model_number:
+                pending.append((device, DeviceDetailsResponse))
+                requests.append(_limited(self._request("GET", f"/v3/devices/{serial}")))
+            if device.room_temp_offset is None:
+                pending.append((device, DeviceStatusResponse))
+                requests.append(_limited(self.async_get_device_status(serial)))
+
+        results = await asyncio.gather(*requests, return_exceptions=True)
+        for (device, response_model), result in zip(pending, results):
+            # Best-effort; skip requests that failed or returned nothing usable
+            if not isinstance(result, dict):
                 continue
             try:
-                status = await self.async_get_device_status(serial)
-                if isinstance(status, dict):
-                    DeviceStatusResponse.model_validate(status).apply_to_device(device)
+                response_model.model_validate(result).apply_to_device(device)
             except Exception:
                 continue
         return devices
@@ -1,5 +1,7 @@
 """Constants for the Mitsubishi Comfort (Kumo Cloud) client."""
 
+import os
+
 BASE_URL = "https://app-prod.kumocloud.com"
 SOCKET_URL = "https://socket-prod.kumocloud.com"
 
@@ -21,3 +23,17 @@ DEFAULT_HEADERS = {
 
 # Request types used to force adapters to respond with fresh data
 DEFAULT_FORCE_REQUESTS: tuple[str, ...] = ("iuStatus", "profile", "adapterStatus", "mhk2")
+
+# Upper bound for concurrent per-device REST requests
+MAX_CONCURRENT_REQUESTS = 8
+
+# operationMode values reported by the API
+OPERATION_MODES = frozenset({"off", "heat", "cool", "auto", "autoHeat", "autoCool", "dry", "vent"})
+# Values accepted from the API for fanSpeed and airDirection
+VALID_FAN_SPEEDS = frozenset({"superQuiet", "quiet", "low", "powerful", "superPowerful", "auto"})
+VALID_AIR_DIRECTIONS = frozenset(
+    {"auto", "horizontal", "midhorizontal", "midpoint", "midvertical", "vertical", "swing"}
+)
+
+# Keep every received payload on DeviceState.raw for debugging; off by default to save memory
+STORE_RAW_PAYLOADS = os.environ.get("KUMO_STORE_RAW_PAYLOADS", "").lower() in ("1", "true", "yes")
@@ -0,0 +1,43 @@
+"""JSON helpers that use orjson when available.
+
+Decoders raise ValueError (or a subclass) on malformed input either way.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+
+if orjson is not None:
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    def json_dumps_pretty(obj: Any) -> str:
+        """Serialize obj to indented, key-sorted JSON for logging."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+
+    def json_loads(data: bytes | str) -> Any:
+        """Parse JSON straight from bytes without decoding to str first."""
+        return orjson.loads(data)
+
+else:
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def json_dumps_pretty(obj: Any) -> str:
+        """Serialize obj to indented, key-sorted JSON for logging."""
+        return json.dumps(obj, indent=2, sort_keys=True)
+
+    def json_loads(data: bytes | str) -> Any:
+        """Parse JSON straight from bytes without decoding to str first."""
+        return json.loads(data)
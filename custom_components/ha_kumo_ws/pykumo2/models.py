@@ -2,14 +2,45 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 from typing import Any
 
-from .payloads import DeviceUpdatePayload, ZoneResponse
-
-
-@dataclass
+from .const import VALID_AIR_DIRECTIONS, VALID_FAN_SPEEDS
+from .payloads import ZoneResponse, apply_device_update
+
+# Device attributes read by entities; socket updates touching these notify listeners
+STATE_FIELDS = (
+    "operation_mode",
+    "power",
+    "connected",
+    "fan_speed",
+    "air_direction",
+    "room_temp",
+    "sp_cool",
+    "sp_heat",
+    "humidity",
+    "room_temp_offset",
+    "schedule_owner",
+    "rssi",
+    "two_figures_code",
+    "serial_number",
+    "model_number",
+    "display_config",
+)
+state_snapshot = attrgetter(*STATE_FIELDS)
+# Equality also covers REST-only fields, so a reused DeviceState never hides their changes
+_eq_snapshot = attrgetter(*STATE_FIELDS, "name", "zone_id", "last_status_change")
+
+_UTC = timezone.utc
+# Token lifetimes observed from the Kumo Cloud API
+ACCESS_TOKEN_TTL = timedelta(minutes=18)
+REFRESH_TOKEN_TTL = timedelta(days=25)
+
+
+@dataclass(slots=True)
 class TokenInfo:
     """JWT token information with expiration tracking."""
 
@@ -17,46 +48,49 @@ class TokenInfo:
     refresh: str
     access_expires_at: datetime
     refresh_expires_at: datetime
+    # Monotonic-clock deadlines for the expiry checks; the datetimes are for display
+    access_deadline: float = field(init=False, repr=False)
+    refresh_deadline: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        now = datetime.now(_UTC)
+        mono = time.monotonic()
+        self.access_deadline = mono + (self.access_expires_at - now).total_seconds()
+        self.refresh_deadline = mono + (self.refresh_expires_at - now).total_seconds()
 
     @classmethod
     def from_response(cls, data: dict[str, Any]) -> "TokenInfo":
         """Create TokenInfo from an auth response."""
-        now = datetime.now(timezone.utc)
+        now = datetime.now(_UTC)
         return cls(
             access=data.get("access", ""),
             refresh=data.get("refresh", ""),
-            access_expires_at=now + timedelta(minutes=18),
-            refresh_expires_at=now + timedelta(days=25),
+            access_expires_at=now + ACCESS_TOKEN_TTL,
+            refresh_expires_at=now + REFRESH_TOKEN_TTL,
         )
 
     def is_access_expired(self) -> bool:
-        return datetime.now(timezone.utc) >= self.access_expires_at
+        return time.monotonic() >= self.access_deadline
+
+    def is_access_near_expiry(self, margin: float = 60) -> bool:
+        return time.monotonic() >= self.access_deadline - margin
 
     def is_refresh_expired(self) -> bool:
-        return datetime.now(timezone.utc) >= self.refresh_expires_at
+        return time.monotonic() >= self.refresh_deadline
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class DeviceState:
-    """Holds the latest known state for a single device."""
-
-    VALID_FAN_SPEEDS = {
-        "superQuiet",
-        "quiet",
-        "low",
-        "powerful",
-        "superPowerful",
-        "auto",
-    }
-    VALID_AIR_DIRECTIONS = {
-        "auto",
-        "horizontal",
-        "midhorizontal",
-        "midpoint",
-        "midvertical",
-        "vertical",
-        "swing",
-    }
+    """Holds the latest known state for a single device.
+
+    Two states compare equal when they describe the same serial and agree on every
+    field in STATE_FIELDS plus name, zone_id and last_status_change, so unchanged
+    polls do not wake entities.
+    """
+
+    # Kept for callers that read them off the class; the module constants are canonical
+    VALID_FAN_SPEEDS = VALID_FAN_SPEEDS
+    VALID_AIR_DIRECTIONS = VALID_AIR_DIRECTIONS
 
     serial: str
     name: str
@@ -78,6 +112,7 @@ class DeviceState:
     serial_number: str | None = None
     model_number: str | None = None
     display_config: dict[str, Any] = field(default_factory=dict)
+    # Received payloads, only populated when KUMO_STORE_RAW_PAYLOADS is set
     raw: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
@@ -86,6 +121,11 @@ class DeviceState:
         if self.model_number is None and self.raw:
             self.model_number = self.raw.get("modelNumber")
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DeviceState):
+            return NotImplemented
+        return self.serial == other.serial and _eq_snapshot(self) == _eq_snapshot(other)
+
     def target_temperature(self) -> float | None:
         """Return the active target setpoint in Celsius."""
         if self.operation_mode == "cool":
@@ -105,5 +145,4 @@ class DeviceState:
 
     def apply_update(self, payload: dict[str, Any]) -> None:
         """Merge any payload into the device state."""
-        device_payload = DeviceUpdatePayload.model_validate(payload)
-        device_payload.apply_to_device(self)
+        apply_device_update(self, payload)
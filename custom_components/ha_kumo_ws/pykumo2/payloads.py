@@ -3,9 +3,17 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, TYPE_CHECKING
+import sys
+from typing import Any, Callable, Iterable, TYPE_CHECKING
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from .const import (
+    OPERATION_MODES,
+    STORE_RAW_PAYLOADS,
+    VALID_AIR_DIRECTIONS,
+    VALID_FAN_SPEEDS,
+)
 
 if TYPE_CHECKING:
     from .models import DeviceState
@@ -18,19 +26,23 @@ class KumoBaseModel(BaseModel):
 
     model_config = ConfigDict(extra="allow", populate_by_name=True)
 
+    _raw_cache: dict[str, Any] | None = PrivateAttr(default=None)
+
     def model_post_init(self, __context: Any) -> None:
-        extras = getattr(self, "__pydantic_extra__", None) or {}
+        # extra="allow" always sets __pydantic_extra__; unknown keys are kept for device.raw
+        extras = self.__pydantic_extra__
         if extras:
-            _LOGGER.warning(
-                "Unexpected keys for %s: %s",
-                self.__class__.__name__,
-                sorted(extras.keys()),
-            )
+            _LOGGER.warning("Unexpected keys for %s: %s", type(self).__name__, sorted(extras))
 
     def raw_payload(self) -> dict[str, Any]:
-        return self.model_dump(by_alias=True, exclude_none=True)
+        # Subclasses chain store_raw calls, so dump the model at most once
+        if self._raw_cache is None:
+            self._raw_cache = self.model_dump(by_alias=True, exclude_none=True)
+        return self._raw_cache
 
     def store_raw(self, device: "DeviceState", key: str | None = None) -> None:
+        if not STORE_RAW_PAYLOADS:
+            return
         payload = self.raw_payload()
         if key:
             device.raw[key] = payload
@@ -65,36 +77,11 @@ class DeviceStatePayload(KumoBaseModel):
     displayConfig: DisplayConfigPayload | None = None
 
     def apply_to_device(self, device: "DeviceState") -> None:
-        if self.roomTemp is not None:
-            device.room_temp = self.roomTemp
-        if self.spCool is not None:
-            device.sp_cool = self.spCool
-        if self.spHeat is not None:
-            device.sp_heat = self.spHeat
-        if self.humidity is not None:
-            device.humidity = self.humidity
-        if self.operationMode is not None:
-            device.operation_mode = self.operationMode
-        if self.power is not None:
-            device.power = bool(self.power)
-        if self.fanSpeed is not None and self.fanSpeed in device.VALID_FAN_SPEEDS:
-            device.fan_speed = self.fanSpeed
-        if self.airDirection is not None and self.airDirection in device.VALID_AIR_DIRECTIONS:
-            device.air_direction = self.airDirection
-        if self.scheduleOwner is not None:
-            device.schedule_owner = self.scheduleOwner
-        if self.rssi is not None:
-            device.rssi = self.rssi
-        if self.twoFiguresCode is not None:
-            device.two_figures_code = self.twoFiguresCode
-        if self.serialNumber is not None:
-            device.serial_number = self.serialNumber
-        if self.modelNumber is not None:
-            device.model_number = self.modelNumber
-        if self.connected is not None:
-            device.connected = bool(self.connected)
-        if self.displayConfig is not None:
-            device.display_config = self.displayConfig.raw_payload()
+        fields = _convert_fields(
+            type(self).__name__, ((key, getattr(self, key)) for key in FIELD_SPECS)
+        )
+        for attr, value in fields.items():
+            setattr(device, attr, value)
         self.store_raw(device)
 
 
@@ -119,6 +106,130 @@ class DeviceUpdatePayload(DeviceStatePayload):
     date: str | None = None
 
 
+Converter = Callable[[Any], Any]
+
+
+def _interned(values: frozenset[str]) -> dict[str, str]:
+    return {value: sys.intern(value) for value in values}
+
+
+# Map decoded strings onto one shared object per known value; lookups double as validation
+_fan_speed = _interned(VALID_FAN_SPEEDS).get
+_air_direction = _interned(VALID_AIR_DIRECTIONS).get
+_OPERATION_MODES = _interned(OPERATION_MODES)
+
+
+# Socket frames skip pydantic, so these mirror its lax-mode bool/int coercion
+_TRUE_STRINGS = frozenset({"1", "on", "t", "true", "y", "yes"})
+_FALSE_STRINGS = frozenset({"0", "off", "f", "false", "n", "no"})
+
+
+def _lax_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"invalid boolean: {value!r}")
+
+
+def _lax_int(value: Any) -> int:
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        return int(value)
+    raise ValueError(f"invalid integer: {value!r}")
+
+
+def _power(value: Any) -> bool:
+    # The API models power as an int flag
+    return bool(_lax_int(value))
+
+
+def _operation_mode(value: Any) -> Any:
+    return _OPERATION_MODES.get(value, value)
+
+
+def _display_config(value: Any) -> dict[str, Any] | None:
+    if isinstance(value, KumoBaseModel):
+        return value.raw_payload()
+    if not isinstance(value, dict):
+        return None
+    return {key: flag for key, flag in value.items() if flag is not None}
+
+
+# API key -> (DeviceState attribute, converter); a converter returning None skips the key.
+# Shared by DeviceStatePayload.apply_to_device and the socket fast path.
+FIELD_SPECS: dict[str, tuple[str, Converter | None]] = {
+    "roomTemp": ("room_temp", float),
+    "spCool": ("sp_cool", float),
+    "spHeat": ("sp_heat", float),
+    "humidity": ("humidity", float),
+    "operationMode": ("operation_mode", _operation_mode),
+    "power": ("power", _power),
+    "fanSpeed": ("fan_speed", _fan_speed),
+    "airDirection": ("air_direction", _air_direction),
+    "scheduleOwner": ("schedule_owner", None),
+    "rssi": ("rssi", _lax_int),
+    "twoFiguresCode": ("two_figures_code", None),
+    "serialNumber": ("serial_number", None),
+    "modelNumber": ("model_number", None),
+    "connected": ("connected", _lax_bool),
+    "displayConfig": ("display_config", _display_config),
+}
+_DEVICE_UPDATE_KEYS = frozenset(DeviceUpdatePayload.model_fields)
+
+
+def _convert_fields(model_name: str, items: Iterable[tuple[str, Any]]) -> dict[str, Any]:
+    """Map API keys to DeviceState attribute values, skipping and logging invalid ones.
+
+    Everything is converted before anything is applied, so a bad value never leaves a
+    device half-updated.
+    """
+    fields: dict[str, Any] = {}
+    for key, value in items:
+        spec = FIELD_SPECS.get(key)
+        if spec is None or value is None:
+            continue
+        attr, convert = spec
+        if convert is not None:
+            try:
+                value = convert(value)
+            except (TypeError, ValueError):
+                _LOGGER.warning("Ignoring invalid %s for %s: %r", key, model_name, value)
+                continue
+            if value is None:
+                continue
+        fields[attr] = value
+    return fields
+
+
+def _warn_unexpected(
+    model: type[KumoBaseModel], payload: dict[str, Any], known: frozenset[str]
+) -> None:
+    """Log keys the model does not declare, as KumoBaseModel.model_post_init does."""
+    unexpected = payload.keys() - known
+    if unexpected:
+        _LOGGER.warning("Unexpected keys for %s: %s", model.__name__, sorted(unexpected))
+
+
+def apply_device_update(device: "DeviceState", payload: dict[str, Any]) -> None:
+    """Apply a socket device_update frame without building a pydantic model."""
+    _warn_unexpected(DeviceUpdatePayload, payload, _DEVICE_UPDATE_KEYS)
+    fields = _convert_fields(DeviceUpdatePayload.__name__, payload.items())
+    for attr, value in fields.items():
+        setattr(device, attr, value)
+    if STORE_RAW_PAYLOADS:
+        device.raw.update({key: value for key, value in payload.items() if value is not None})
+
+
 class DeviceStatusV2Payload(KumoBaseModel):
     deviceSerial: str | None = None
     status: str | None = None
@@ -132,6 +243,8 @@ class DeviceStatusV2Payload(KumoBaseModel):
     def apply_to_device(self, device: "DeviceState") -> None:
         if self.status is not None:
             device.connected = self.status == "connected"
+        if not STORE_RAW_PAYLOADS:
+            return
         if self.lastTimeConnected is not None:
             device.raw["lastTimeConnected"] = self.lastTimeConnected
         if self.lastTimeDisconnected is not None:
@@ -141,6 +254,42 @@ class DeviceStatusV2Payload(KumoBaseModel):
         self.store_raw(device, "device_status_v2")
 
 
+_DEVICE_STATUS_V2_KEYS = frozenset(DeviceStatusV2Payload.model_fields)
+# Accepted types per declared key, matching the model's field annotations
+_STATUS_V2_TYPES: dict[str, type | tuple[type, ...]] = {
+    key: (str, bool) if key == "hasIduCommunicationError" else str
+    for key in _DEVICE_STATUS_V2_KEYS
+}
+# Connection details also copied to the top level of device.raw
+_STATUS_V2_RAW_KEYS = ("lastTimeConnected", "lastTimeDisconnected", "lastDisconnectedReason")
+
+
+def apply_device_status_v2(device: "DeviceState", payload: dict[str, Any]) -> None:
+    """Apply a socket device_status_v2 frame without building a pydantic model."""
+    _warn_unexpected(DeviceStatusV2Payload, payload, _DEVICE_STATUS_V2_KEYS)
+    # Check the whole frame first; like model validation, one bad field rejects it untouched
+    invalid = sorted(
+        key
+        for key, expected in _STATUS_V2_TYPES.items()
+        if (value := payload.get(key)) is not None and not isinstance(value, expected)
+    )
+    if invalid:
+        _LOGGER.warning("Ignoring %s with invalid %s", DeviceStatusV2Payload.__name__, invalid)
+        return
+    status = payload.get("status")
+    if status is not None:
+        device.connected = status == "connected"
+    if not STORE_RAW_PAYLOADS:
+        return
+    for key in _STATUS_V2_RAW_KEYS:
+        value = payload.get(key)
+        if value is not None:
+            device.raw[key] = value
+    device.raw["device_status_v2"] = {
+        key: value for key, value in payload.items() if value is not None
+    }
+
+
 class ProfileUpdatePayload(KumoBaseModel):
     hasModeDry: bool | None = None
     hasModeHeat: bool | None = None
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import inspect
 import logging
 from typing import Awaitable, Callable, Iterable
 
@@ -11,10 +11,18 @@ import socketio
 
 from .client import MitsubishiComfortClient
 from .const import DEFAULT_FORCE_REQUESTS, SOCKET_URL
+from .jsonutil import json_dumps_pretty
 
 _LOGGER = logging.getLogger(__name__)
 
 SocketCallback = Callable[[str, dict], Awaitable[None] | None]
+RefreshPredicate = Callable[[], bool]
+
+
+def _log_frame(event: str, data: dict) -> None:
+    """Pretty-print a received frame, only when debug logging is enabled."""
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Socket %s:\n%s", event, json_dumps_pretty(data))
 
 
 class SocketUpdateManager:
@@ -27,16 +35,26 @@ class SocketUpdateManager:
         callback: SocketCallback,
         refresh_on_connect: bool = True,
         request_types: tuple[str, ...] = DEFAULT_FORCE_REQUESTS,
+        refresh_predicate: RefreshPredicate | None = None,
     ) -> None:
         self._client = client
-        self._serials = list(dict.fromkeys(device_serials))
+        self._serials: tuple[str, ...] = tuple(dict.fromkeys(device_serials))
         self._callback = callback
+        # Sync or async is fixed per callback, so decide once instead of per frame
+        self._callback_is_async = inspect.iscoroutinefunction(callback)
         self._refresh_on_connect = refresh_on_connect
         self._request_types = request_types
+        # force_adapter_request arguments, built once and replayed on every (re)connect
+        self._force_pairs: tuple[tuple[str, str], ...] = tuple(
+            (serial, request_type) for serial in self._serials for request_type in request_types
+        )
+        self._refresh_predicate = refresh_predicate
 
         self._sio: socketio.AsyncClient | None = None
         self._wait_task: asyncio.Task | None = None
-        self._stopping = asyncio.Event()
+        self._stopping = False
+        # The refresh predicate only gates reconnects; the first connect always refreshes
+        self._connected_before = False
         self._reconnect_task: asyncio.Task | None = None
 
     @property
@@ -83,7 +101,7 @@ class SocketUpdateManager:
 
     async def stop(self) -> None:
         """Disconnect and stop waiting for events."""
-        self._stopping.set()
+        self._stopping = True
         if self._reconnect_task:
             self._reconnect_task.cancel()
             self._reconnect_task = None
@@ -103,19 +121,25 @@ class SocketUpdateManager:
             return
 
         _LOGGER.debug("Socket connected, subscribing to %s", self._serials)
-        for serial in self._serials:
-            await self._sio.emit("subscribe", serial)
-            await self._sio.emit("device_status_v2", serial)
-            if self._refresh_on_connect:
-                for request_type in self._request_types:
-                    await self._sio.emit("force_adapter_request", (serial, request_type))
+        force_refresh = self._refresh_on_connect and (
+            not self._connected_before
+            or self._refresh_predicate is None
+            or self._refresh_predicate()
+        )
+        self._connected_before = True
+        sio = self._sio
+        emits = [sio.emit("subscribe", serial) for serial in self._serials]
+        emits.extend(sio.emit("device_status_v2", serial) for serial in self._serials)
+        if force_refresh:
+            emits.extend(sio.emit("force_adapter_request", pair) for pair in self._force_pairs)
+        await asyncio.gather(*emits)
 
         await self._dispatch("connected", {"devices": self._serials})
 
     async def _on_disconnect(self) -> None:
         await self._dispatch("disconnected", {})
         _LOGGER.debug("Socket disconnected")
-        if not self._stopping.is_set() and not self._reconnect_task:
+        if not self._stopping and not self._reconnect_task:
             self._reconnect_task = asyncio.create_task(self._attempt_reconnect())
 
     async def _on_connect_error(self, data) -> None:
@@ -123,23 +147,23 @@ class SocketUpdateManager:
         await self._dispatch("connect_error", {"error": str(data)})
 
     async def _on_device_update(self, data: dict) -> None:
-        _LOGGER.debug("Socket device_update:\n%s", json.dumps(data, indent=2, sort_keys=True))
+        _log_frame("device_update", data)
         await self._dispatch("device_update", data)
 
     async def _on_device_status(self, data: dict) -> None:
-        _LOGGER.debug("Socket device_status_v2:\n%s", json.dumps(data, indent=2, sort_keys=True))
+        _log_frame("device_status_v2", data)
         await self._dispatch("device_status_v2", data)
 
     async def _on_profile_update(self, data: dict) -> None:
-        _LOGGER.debug("Socket profile_update:\n%s", json.dumps(data, indent=2, sort_keys=True))
+        _log_frame("profile_update", data)
         await self._dispatch("profile_update", data)
 
     async def _on_adapter_update(self, data: dict) -> None:
-        _LOGGER.debug("Socket adapter_update:\n%s", json.dumps(data, indent=2, sort_keys=True))
+        _log_frame("adapter_update", data)
         await self._dispatch("adapter_update", data)
 
     async def _on_acoil_update(self, data: dict) -> None:
-        _LOGGER.debug("Socket acoil_update:\n%s", json.dumps(data, indent=2, sort_keys=True))
+        _log_frame("acoil_update", data)
         await self._dispatch("acoil_update", data)
 
     async def _dispatch(self, event: str, payload: dict) -> None:
@@ -148,15 +172,19 @@ class SocketUpdateManager:
             return
 
         try:
-            result = self._callback(event, payload)
-            if asyncio.iscoroutine(result):
-                await result
+            if self._callback_is_async:
+                await self._callback(event, payload)
+            else:
+                result = self._callback(event, payload)
+                # Callables not detected as async may still return an awaitable
+                if inspect.isawaitable(result):
+                    await result
         except Exception as exc:  # pragma: no cover - defensive
             _LOGGER.warning("Socket callback failure for %s: %s", event, exc)
 
     async def _attempt_reconnect(self) -> None:
         """Retry connecting until stopped."""
-        while not self._stopping.is_set():
+        while not self._stopping:
             try:
                 _LOGGER.debug("Attempting socket reconnect")
                 await self.start()
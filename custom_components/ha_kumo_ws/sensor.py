@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import MitsubishiComfortCoordinator
-from .pykumo2 import MitsubishiComfortClient
+
+if TYPE_CHECKING:
+    from .pykumo2 import DeviceState, MitsubishiComfortClient
 
 
 async def async_setup_entry(
@@ -22,25 +26,21 @@ async def async_setup_entry(
     """Set up Mitsubishi Comfort sensors."""
     stored = hass.data[DOMAIN][entry.entry_id]
     coordinator: MitsubishiComfortCoordinator = stored["coordinator"]
+    client = stored["client"]
     async_add_entities(
-        entity
-        for serial in coordinator.data
-        for entity in _build_sensors(coordinator, stored["client"], serial)
+        [
+            sensor_cls(coordinator, client, serial)
+            for serial in coordinator.data
+            for sensor_cls in _SENSOR_CLASSES
+        ]
     )
 
 
-def _build_sensors(
-    coordinator: MitsubishiComfortCoordinator,
-    client: MitsubishiComfortClient,
-    serial: str,
-):
-    yield MitsubishiComfortRssiSensor(coordinator, client, serial)
-    yield MitsubishiComfortTwoFiguresCodeSensor(coordinator, client, serial)
-
-
 class _BaseMitsubishiSensor(CoordinatorEntity[MitsubishiComfortCoordinator], SensorEntity):
     """Shared behavior for Mitsubishi Comfort sensors."""
 
+    __slots__ = ("_client", "_serial", "_device")
+
     _attr_should_poll = False
 
     def __init__(
@@ -54,31 +54,34 @@ class _BaseMitsubishiSensor(CoordinatorEntity[MitsubishiComfortCoordinator], Sen
         self._client = client
         self._serial = serial
         device = coordinator.data.get(serial)
+        self._device: DeviceState | None = device
         base_name = device.name if device else serial
         self._attr_unique_id = f"mitsubishi_comfort_{serial}_{name_suffix}"
         self._attr_name = f"{base_name} {name_suffix}"
+        if device:
+            self._attr_device_info = {
+                "identifiers": {(DOMAIN, device.serial)},
+                "name": device.name,
+                "manufacturer": "Mitsubishi Electric",
+                "model": device.model_number or device.raw.get("modelNumber"),
+                "serial_number": device.serial_number or device.serial,
+            }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._device = self.coordinator.data.get(self._serial)
+        super()._handle_coordinator_update()
 
     @property
     def device(self):
-        return self.coordinator.data.get(self._serial)
-
-    @property
-    def device_info(self):
-        device = self.device
-        if not device:
-            return None
-        return {
-            "identifiers": {(DOMAIN, device.serial)},
-            "name": device.name,
-            "manufacturer": "Mitsubishi Electric",
-            "model": device.model_number or device.raw.get("modelNumber"),
-            "serial_number": device.serial_number or device.serial,
-        }
+        return self._device
 
 
 class MitsubishiComfortRssiSensor(_BaseMitsubishiSensor):
     """Expose RSSI as a sensor."""
 
+    __slots__ = ()
+
     _attr_native_unit_of_measurement = SIGNAL_STRENGTH_DECIBELS_MILLIWATT
     _attr_icon = "mdi:wifi"
 
@@ -92,13 +95,15 @@ class MitsubishiComfortRssiSensor(_BaseMitsubishiSensor):
 
     @property
     def native_value(self):
-        device = self.device
+        device = self._device
         return device.rssi if device else None
 
 
 class MitsubishiComfortTwoFiguresCodeSensor(_BaseMitsubishiSensor):
     """Expose twoFiguresCode as a sensor."""
 
+    __slots__ = ()
+
     _attr_icon = "mdi:numeric"
 
     def __init__(
@@ -111,5 +116,12 @@ class MitsubishiComfortTwoFiguresCodeSensor(_BaseMitsubishiSensor):
 
     @property
     def native_value(self):
-        device = self.device
+        device = self._device
         return device.two_figures_code if device else None
+
+
+# Sensors created for every device, in entity registration order
+_SENSOR_CLASSES: tuple[type[_BaseMitsubishiSensor], ...] = (
+    MitsubishiComfortRssiSensor,
+    MitsubishiComfortTwoFiguresCodeSensor,
+)
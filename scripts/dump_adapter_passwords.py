@@ -5,10 +5,14 @@ from __future__ import annotations
 import argparse
 import asyncio
 
+from pydantic import TypeAdapter
+
 from custom_components.ha_kumo_ws.pykumo2 import MitsubishiComfortClient
 from custom_components.ha_kumo_ws.pykumo2.payloads import AdapterUpdatePayload
 from custom_components.ha_kumo_ws.pykumo2.socket import SocketUpdateManager
 
+_ADAPTER_UPDATE_ADAPTER = TypeAdapter(AdapterUpdatePayload)
+
 
 async def _resolve_site_ids(client: MitsubishiComfortClient) -> list[str]:
     sites = await client.async_get_sites()
@@ -16,11 +20,9 @@ async def _resolve_site_ids(client: MitsubishiComfortClient) -> list[str]:
 
 
 async def _fetch_devices(client: MitsubishiComfortClient, site_ids: list[str]):
-    devices: dict[str, str] = {}
-    for site_id in site_ids:
-        for serial, device in (await client.async_get_devices(site_id)).items():
-            devices[serial] = device.name
-    return devices
+    # Sites are independent, so fetch them concurrently
+    per_site = await asyncio.gather(*(client.async_get_devices(site_id) for site_id in site_ids))
+    return {serial: device.name for devices in per_site for serial, device in devices.items()}
 
 
 async def _run(username: str, password: str, timeout: float) -> int:
@@ -48,14 +50,15 @@ async def _run(username: str, password: str, timeout: float) -> int:
         async def _on_event(event: str, payload: dict) -> None:
             if event != "adapter_update":
                 return
-            update = AdapterUpdatePayload.model_validate(payload)
-            serial = update.deviceSerial
-            if not serial or serial not in devices:
+            # Skip foreign and already-dumped devices before paying for validation
+            serial = payload.get("deviceSerial")
+            if serial not in pending:
                 return
-            if update.password is None or serial in found:
+            update = _ADAPTER_UPDATE_ADAPTER.validate_python(payload)
+            if update.password is None:
                 return
+            # Printed in one batch after the wait so the socket reader is not stalled
             found[serial] = update.password
-            print(f"{serial} ({devices[serial]}): {update.password}")
             pending.discard(serial)
             if not pending:
                 done.set()
@@ -69,13 +72,23 @@ async def _run(username: str, password: str, timeout: float) -> int:
         )
 
         await manager.start()
+        timed_out = False
         try:
             await asyncio.wait_for(done.wait(), timeout=timeout)
         except asyncio.TimeoutError:
-            if pending:
-                print("Timed out waiting for adapter_update on: " + ", ".join(sorted(pending)))
+            timed_out = True
         finally:
             await manager.stop()
+
+        if found:
+            print(
+                "\n".join(
+                    f"{serial} ({devices[serial]}): {password}"
+                    for serial, password in found.items()
+                )
+            )
+        if timed_out and pending:
+            print("Timed out waiting for adapter_update on: " + ", ".join(sorted(pending)))
     finally:
         await client.close()
     return 0
@@ -9,69 +9,88 @@ Body: {"c":{"indoorUnit":{"status":{}}}}
 Then report hosts whose response body matches:
 {"_api_error": "device_authentication_error"}
 
-Outputs a JSON list of matching IPs to stdout; progress/logs go to stderr.
+Prints each matching IP to stdout as it is found (or a single JSON list with
+--format json); progress/logs go to stderr.
 
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import ipaddress
 import json
 import socket
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import aclosing
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 
-import requests
+import aiohttp
 
 PUT_PATH = "/api?m="
 PUT_JSON = {"c": {"indoorUnit": {"status": {}}}}
 TARGET_STR = '{"_api_error": "device_authentication_error"}'
+TARGET_BYTES = TARGET_STR.encode("ascii")
 
+# Serialized once; every host gets the identical request body
+PUT_BODY = json.dumps(PUT_JSON, separators=(",", ":")).encode("ascii")
+PUT_HEADERS = {"Content-Type": "application/json"}
 
-@dataclass
+# The sentinel reply is tiny; stop reading any response after this many bytes
+MAX_BODY = 4096
+READ_CHUNK = 512
+
+
+@dataclass(slots=True)
 class Result:
     ip: str
     port_open: bool
     matched: bool
     status_code: Optional[int] = None
-    body: Optional[str] = None
+    body: Optional[bytes] = None
     error: Optional[str] = None
 
 
-def tcp_port_open(ip: str, port: int, timeout: float) -> bool:
-    try:
-        with socket.create_connection((ip, port), timeout=timeout):
-            return True
-    except OSError:
-        return False
-
-
-def check_host(ip: str, connect_timeout: float, http_timeout: float) -> Result:
-    if not tcp_port_open(ip, 80, timeout=connect_timeout):
-        return Result(ip=ip, port_open=False, matched=False)
-
+async def check_host(
+    session: aiohttp.ClientSession,
+    ip: str,
+    timeout: aiohttp.ClientTimeout,
+) -> Result:
     url = f"http://{ip}{PUT_PATH}"
     try:
-        r = requests.put(
+        # The connect phase doubles as the port probe; no separate TCP handshake
+        async with session.put(
             url,
-            json=PUT_JSON,
-            headers={"Content-Type": "application/json"},
-            timeout=(http_timeout),
-        )
-        body = (r.text or "").strip()
-        matched = TARGET_STR in body
-        return Result(
-            ip=ip,
-            port_open=True,
-            matched=matched,
-            status_code=r.status_code,
-            body=body,
-        )
-    except requests.RequestException as e:
-        return Result(ip=ip, port_open=True, matched=False, error=str(e))
+            data=PUT_BODY,
+            headers=PUT_HEADERS,
+            timeout=timeout,
+            allow_redirects=False,
+        ) as r:
+            # Match on raw bytes; the body is only decoded for verbose output
+            buf = bytearray()
+            matched = False
+            while len(buf) < MAX_BODY:
+                chunk = await r.content.read(READ_CHUNK)
+                if not chunk:
+                    break
+                buf += chunk
+                if TARGET_BYTES in buf:
+                    matched = True
+                    break
+            body = bytes(buf[:MAX_BODY])
+            return Result(
+                ip=ip,
+                port_open=True,
+                matched=matched,
+                status_code=r.status,
+                body=body,
+            )
+    except (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError):
+        # Refused, unreachable, or no answer within the connect timeout
+        return Result(ip=ip, port_open=False, matched=False)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        return Result(ip=ip, port_open=True, matched=False, error=str(e) or type(e).__name__)
 
 
 def parse_args() -> argparse.Namespace:
@@ -83,7 +102,9 @@ def parse_args() -> argparse.Namespace:
         "cidr",
         help='IP range in CIDR notation, e.g. "192.168.4.0/24"',
     )
-    p.add_argument("--workers", type=int, default=255, help="Concurrent workers (default: 255)")
+    p.add_argument(
+        "--workers", type=int, default=255, help="Concurrent connections (default: 255)"
+    )
     p.add_argument(
         "--connect-timeout",
         type=float,
@@ -96,6 +117,18 @@ def parse_args() -> argparse.Namespace:
         default=10,
         help="HTTP read timeout seconds (default: 10)",
     )
+    p.add_argument(
+        "--max-matches",
+        type=int,
+        default=0,
+        help="Stop once this many matches are found (default: 0, scan everything)",
+    )
+    p.add_argument(
+        "--format",
+        choices=("lines", "json"),
+        default="lines",
+        help="stdout format: one IP per line as found, or a JSON list at the end (default: lines)",
+    )
     p.add_argument(
         "--verbose",
         action="store_true",
@@ -104,32 +137,71 @@ def parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
-def main() -> int:
-    args = parse_args()
+def _host_count(net: ipaddress.IPv4Network | ipaddress.IPv6Network) -> int:
+    """Number of addresses net.hosts() yields, without iterating it."""
+    if net.version == 4:
+        return net.num_addresses - 2 if net.prefixlen < 31 else net.num_addresses
+    return net.num_addresses - 1 if net.prefixlen < 127 else net.num_addresses
 
-    try:
-        net = ipaddress.ip_network(args.cidr, strict=False)
-    except ValueError as e:
-        print(f"Invalid CIDR '{args.cidr}': {e}", file=sys.stderr)
-        return 2
 
-    hosts = [str(ip) for ip in net.hosts()]
-    total = len(hosts)
-    print(f"Scanning {net} ({total} hosts) ...", file=sys.stderr)
+def _iter_hosts(net: ipaddress.IPv4Network | ipaddress.IPv6Network) -> Iterator[str]:
+    """Yield the same addresses as net.hosts(), as strings."""
+    if net.version == 4:
+        # Format IPv4 straight from the integer range instead of building IPv4Address objects
+        start = int(net.network_address)
+        end = int(net.broadcast_address)
+        if net.prefixlen < 31:
+            start, end = start + 1, end - 1
+        return (socket.inet_ntoa(n.to_bytes(4, "big")) for n in range(start, end + 1))
+    return map(str, net.hosts())
 
+
+async def _iter_results(
+    net: ipaddress.IPv4Network | ipaddress.IPv6Network, args: argparse.Namespace
+) -> AsyncIterator[Result]:
+    """Yield results as they complete, keeping at most --workers hosts in flight."""
+    timeout = aiohttp.ClientTimeout(
+        total=None, sock_connect=args.connect_timeout, sock_read=args.http_timeout
+    )
+    connector = aiohttp.TCPConnector(limit=args.workers)
+    # One-shot requests to LAN devices: no cookies to keep, no proxy/netrc lookups
+    async with aiohttp.ClientSession(
+        connector=connector, cookie_jar=aiohttp.DummyCookieJar(), trust_env=False
+    ) as session:
+        # Hosts are pulled lazily, so memory stays O(workers) even for a /16
+        inflight: set[asyncio.Task[Result]] = set()
+        try:
+            for ip in _iter_hosts(net):
+                inflight.add(asyncio.create_task(check_host(session, ip, timeout)))
+                if len(inflight) < args.workers:
+                    continue
+                done, inflight = await asyncio.wait(
+                    inflight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+            while inflight:
+                done, inflight = await asyncio.wait(
+                    inflight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            # Reached when the caller stops early; drop outstanding hosts before closing
+            for task in inflight:
+                task.cancel()
+            await asyncio.gather(*inflight, return_exceptions=True)
+
+
+async def _scan(
+    net: ipaddress.IPv4Network | ipaddress.IPv6Network, args: argparse.Namespace
+) -> list[str]:
     open_count = 0
     match_count = 0
     matched_devices: list[str] = []
 
-    with ThreadPoolExecutor(max_workers=args.workers) as ex:
-        futures = {
-            ex.submit(check_host, ip, args.connect_timeout, args.http_timeout): ip
-            for ip in hosts
-        }
-
-        for fut in as_completed(futures):
-            res = fut.result()
-
+    async with aclosing(_iter_results(net, args)) as results:
+        async for res in results:
             if not res.port_open:
                 continue
 
@@ -147,9 +219,15 @@ def main() -> int:
                     f"MATCH  {res.ip}  HTTP {res.status_code}  {TARGET_STR}",
                     file=sys.stderr,
                 )
+                if args.format == "lines":
+                    print(res.ip)
+                if args.max_matches and match_count >= args.max_matches:
+                    break
             else:
                 if args.verbose:
-                    body_preview = (res.body or "").replace("\n", "\\n")
+                    body_preview = (
+                        (res.body or b"").strip().decode("utf-8", "replace").replace("\n", "\\n")
+                    )
                     if len(body_preview) > 200:
                         body_preview = body_preview[:200] + "…"
                     print(
@@ -158,7 +236,26 @@ def main() -> int:
                     )
 
     print(f"Done. Port 80 open: {open_count} | Matches: {match_count}", file=sys.stderr)
-    print(json.dumps(matched_devices))
+    return matched_devices
+
+
+def main() -> int:
+    args = parse_args()
+
+    try:
+        net = ipaddress.ip_network(args.cidr, strict=False)
+    except ValueError as e:
+        print(f"Invalid CIDR '{args.cidr}': {e}", file=sys.stderr)
+        return 2
+
+    total = _host_count(net)
+    print(f"Scanning {net} ({total} hosts) ...", file=sys.stderr)
+
+    # Flush each match as it is printed so the output can be piped while scanning
+    sys.stdout.reconfigure(line_buffering=True)
+    matched_devices = asyncio.run(_scan(net, args))
+    if args.format == "json":
+        print(json.dumps(matched_devices))
     return 0
 
 